@@ -29,7 +29,7 @@ G.remove_nodes_from(low_degree)
 # largest connected component
 components = nx.connected_components(G)
 largest_component = max(components, key=len)
-H = G.subgraph(largest_component)
+H = G.subgraph(largest_component).copy()
 
 # compute centrality
 centrality = nx.betweenness_centrality(H, k=10, endpoints=True)
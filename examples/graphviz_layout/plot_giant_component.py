@@ -28,11 +28,12 @@ for p, ax, seed in zip(pvals, axes.ravel(), range(len(pvals))):
     #### generate graph ####
     G = nx.binomial_graph(n, p, seed=seed)
     # identify connected/disconnected nodes
-    connected = [n for n, d in G.degree() if d > 0]
-    disconnected = list(set(G.nodes()) - set(connected))
+    connected, disconnected = [], []
+    for node, d in G.degree():
+        (connected if d > 0 else disconnected).append(node)
     # identify largest connected component
     Gcc = sorted(nx.connected_components(G), key=len, reverse=True)
-    G0 = G.subgraph(Gcc[0])
+    G0 = G.subgraph(Gcc[0]).copy()
     #### draw graph ####
     pos = nx.nx_agraph.graphviz_layout(G)
     ax.set_title(f"p = {p:.3f}")
@@ -43,7 +44,7 @@ for p, ax, seed in zip(pvals, axes.ravel(), range(len(pvals))):
     for Gi in Gcc[1:]:
         if len(Gi) > 1:
             nx.draw_networkx_edges(
-                G.subgraph(Gi),
+                G.subgraph(Gi).copy(),
                 pos,
                 alpha=0.3,
                 width=5.0,
@@ -1,7 +1,6 @@
 import pytest
 import networkx
 import sys
-import warnings
 
 
 def pytest_addoption(parser):
@@ -10,8 +9,52 @@ def pytest_addoption(parser):
     )
 
 
+# TODO: The warnings below need to be dealt with, but for now we silence them.
+# They are registered once as "filterwarnings" ini lines in pytest_configure,
+# which pytest applies around every test.
+ignored_warnings = [
+    (DeprecationWarning, "literal_stringizer is deprecated"),
+    (DeprecationWarning, "literal_destringizer is deprecated"),
+    (DeprecationWarning, "is_string_like is deprecated"),
+    (DeprecationWarning, r"\nauthority_matrix"),
+    (DeprecationWarning, r"\nhub_matrix"),
+    (DeprecationWarning, "default_opener is deprecated"),
+    (DeprecationWarning, "empty_generator is deprecated"),
+    (DeprecationWarning, "make_str is deprecated"),
+    (DeprecationWarning, "generate_unique_node is deprecated"),
+    (DeprecationWarning, "context manager reversed is deprecated"),
+    (DeprecationWarning, "This will return a generator in 3.0*"),
+    (DeprecationWarning, "betweenness_centrality_source"),
+    (DeprecationWarning, "edge_betweeness"),
+    (PendingDeprecationWarning, "the matrix subclass"),
+    (DeprecationWarning, "to_numpy_matrix"),
+    (DeprecationWarning, "from_numpy_matrix"),
+    (DeprecationWarning, "networkx.pagerank_numpy"),
+    (DeprecationWarning, "networkx.pagerank_scipy"),
+    (DeprecationWarning, "write_gpickle"),
+    (DeprecationWarning, "read_gpickle"),
+    (DeprecationWarning, "write_shp"),
+    (DeprecationWarning, "read_shp"),
+    (DeprecationWarning, "edges_from_line"),
+    (DeprecationWarning, "write_yaml"),
+    (DeprecationWarning, "read_yaml"),
+    (DeprecationWarning, "FilterAtlas.copy"),
+    (DeprecationWarning, "FilterAdjacency.copy"),
+    (DeprecationWarning, "FilterMultiAdjacency.copy"),
+    (DeprecationWarning, "FilterMultiInner.copy"),
+    (DeprecationWarning, "jit_data"),
+    (DeprecationWarning, "jit_graph"),
+    (DeprecationWarning, "consume"),
+    (DeprecationWarning, "iterable is deprecated"),
+]
+
+
 def pytest_configure(config):
     config.addinivalue_line("markers", "slow: mark test as slow to run")
+    for category, message in ignored_warnings:
+        config.addinivalue_line(
+            "filterwarnings", f"ignore:{message}:{category.__name__}"
+        )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -24,106 +67,6 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(skip_slow)
 
 
-# TODO: The warnings below need to be dealt with, but for now we silence them.
-@pytest.fixture(autouse=True)
-def set_warnings():
-    warnings.filterwarnings(
-        "ignore",
-        category=DeprecationWarning,
-        message="literal_stringizer is deprecated",
-    )
-    warnings.filterwarnings(
-        "ignore",
-        category=DeprecationWarning,
-        message="literal_destringizer is deprecated",
-    )
-    warnings.filterwarnings(
-        "ignore", category=DeprecationWarning, message="is_string_like is deprecated"
-    )
-    warnings.filterwarnings(
-        "ignore", category=DeprecationWarning, message="\nauthority_matrix"
-    )
-    warnings.filterwarnings(
-        "ignore", category=DeprecationWarning, message="\nhub_matrix"
-    )
-    warnings.filterwarnings(
-        "ignore", category=DeprecationWarning, message="default_opener is deprecated"
-    )
-    warnings.filterwarnings(
-        "ignore", category=DeprecationWarning, message="empty_generator is deprecated"
-    )
-    warnings.filterwarnings(
-        "ignore", category=DeprecationWarning, message="make_str is deprecated"
-    )
-    warnings.filterwarnings(
-        "ignore",
-        category=DeprecationWarning,
-        message="generate_unique_node is deprecated",
-    )
-    warnings.filterwarnings(
-        "ignore",
-        category=DeprecationWarning,
-        message="context manager reversed is deprecated",
-    )
-    warnings.filterwarnings(
-        "ignore",
-        category=DeprecationWarning,
-        message="This will return a generator in 3.0*",
-    )
-    warnings.filterwarnings(
-        "ignore", category=DeprecationWarning, message="betweenness_centrality_source"
-    )
-    warnings.filterwarnings(
-        "ignore", category=DeprecationWarning, message="edge_betweeness"
-    )
-    warnings.filterwarnings(
-        "ignore", category=PendingDeprecationWarning, message="the matrix subclass"
-    )
-    warnings.filterwarnings(
-        "ignore", category=DeprecationWarning, message="to_numpy_matrix"
-    )
-    warnings.filterwarnings(
-        "ignore", category=DeprecationWarning, message="from_numpy_matrix"
-    )
-    warnings.filterwarnings(
-        "ignore", category=DeprecationWarning, message="networkx.pagerank_numpy"
-    )
-    warnings.filterwarnings(
-        "ignore", category=DeprecationWarning, message="networkx.pagerank_scipy"
-    )
-    warnings.filterwarnings(
-        "ignore", category=DeprecationWarning, message="write_gpickle"
-    )
-    warnings.filterwarnings(
-        "ignore", category=DeprecationWarning, message="read_gpickle"
-    )
-    warnings.filterwarnings("ignore", category=DeprecationWarning, message="write_shp")
-    warnings.filterwarnings("ignore", category=DeprecationWarning, message="read_shp")
-    warnings.filterwarnings(
-        "ignore", category=DeprecationWarning, message="edges_from_line"
-    )
-    warnings.filterwarnings("ignore", category=DeprecationWarning, message="write_yaml")
-    warnings.filterwarnings("ignore", category=DeprecationWarning, message="read_yaml")
-    warnings.filterwarnings(
-        "ignore", category=DeprecationWarning, message="FilterAtlas.copy"
-    )
-    warnings.filterwarnings(
-        "ignore", category=DeprecationWarning, message="FilterAdjacency.copy"
-    )
-    warnings.filterwarnings(
-        "ignore", category=DeprecationWarning, message="FilterMultiAdjacency.copy"
-    )
-    warnings.filterwarnings(
-        "ignore", category=DeprecationWarning, message="FilterMultiInner.copy"
-    )
-    warnings.filterwarnings("ignore", category=DeprecationWarning, message="jit_data")
-    warnings.filterwarnings("ignore", category=DeprecationWarning, message="jit_graph")
-    warnings.filterwarnings("ignore", category=DeprecationWarning, message="consume")
-    warnings.filterwarnings(
-        "ignore", category=DeprecationWarning, message="iterable is deprecated"
-    )
-
-
 @pytest.fixture(autouse=True)
 def add_nx(doctest_namespace):
     doctest_namespace["nx"] = networkx
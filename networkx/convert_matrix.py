@@ -204,7 +204,19 @@ def from_pandas_adjacency(df, create_using=None):
     A = df.values
     G = from_numpy_array(A, create_using=create_using)
 
-    nx.relabel.relabel_nodes(G, dict(enumerate(df.columns)), copy=False)
+    # Swap the integer nodes for the column labels by re-adding the edges.
+    # Relabeling in place is slower and fails when the labels are a
+    # permutation of the integer nodes.
+    labels = df.columns.tolist()
+    if G.is_multigraph():
+        edges = [
+            (labels[u], labels[v], k, d) for u, v, k, d in G.edges(keys=True, data=True)
+        ]
+    else:
+        edges = [(labels[u], labels[v], d) for u, v, d in G.edges(data=True)]
+    G.clear()
+    G.add_nodes_from(labels)
+    G.add_edges_from(edges)
     return G
 
 
@@ -278,26 +290,46 @@ def to_pandas_edgelist(
     """
     import pandas as pd
 
-    if nodelist is None:
-        edgelist = G.edges(data=True)
-    else:
-        edgelist = G.edges(nodelist, data=True)
-    source_nodes = [s for s, _, _ in edgelist]
-    target_nodes = [t for _, t, _ in edgelist]
+    # Gather sources, targets, (keys) and attribute values in a single
+    # traversal of the edges. Each attribute column is padded with nan for
+    # the edges that lack the attribute, so no per-edge dicts are retained.
+    nan = float("nan")
+    source_nodes = []
+    target_nodes = []
+    edge_attr = {}
+
+    def add_attrs(i, d):
+        for attr, value in d.items():
+            values = edge_attr.setdefault(attr, [])
+            if len(values) < i:
+                values.extend([nan] * (i - len(values)))
+            values.append(value)
 
-    all_attrs = set().union(*(d.keys() for _, _, d in edgelist))
-    if source in all_attrs:
+    if G.is_multigraph() and edge_key is not None:
+        edge_keys = []
+        for i, (s, t, k, d) in enumerate(G.edges(nodelist, keys=True, data=True)):
+            source_nodes.append(s)
+            target_nodes.append(t)
+            edge_keys.append(k)
+            add_attrs(i, d)
+    else:
+        edge_keys = None
+        for i, (s, t, d) in enumerate(G.edges(nodelist, data=True)):
+            source_nodes.append(s)
+            target_nodes.append(t)
+            add_attrs(i, d)
+    nedges = len(source_nodes)
+    for values in edge_attr.values():
+        values.extend([nan] * (nedges - len(values)))
+
+    if source in edge_attr:
         raise nx.NetworkXError(f"Source name {source!r} is an edge attr name")
-    if target in all_attrs:
+    if target in edge_attr:
         raise nx.NetworkXError(f"Target name {target!r} is an edge attr name")
 
-    nan = float("nan")
-    edge_attr = {k: [d.get(k, nan) for _, _, d in edgelist] for k in all_attrs}
-
-    if G.is_multigraph() and edge_key is not None:
-        if edge_key in all_attrs:
+    if edge_keys is not None:
+        if edge_key in edge_attr:
             raise nx.NetworkXError(f"Edge key name {edge_key!r} is an edge attr name")
-        edge_keys = [k for _, _, k in G.edges(keys=True)]
         edgelistdict = {source: source_nodes, target: target_nodes, edge_key: edge_keys}
     else:
         edgelistdict = {source: source_nodes, target: target_nodes}
@@ -418,7 +450,7 @@ def from_pandas_edgelist(
     g = nx.empty_graph(0, create_using)
 
     if edge_attr is None:
-        g.add_edges_from(zip(df[source], df[target]))
+        g.add_edges_from(zip(df[source].tolist(), df[target].tolist()))
         return g
 
     reserved_columns = [source, target]
@@ -438,7 +470,9 @@ def from_pandas_edgelist(
         )
 
     try:
-        attribute_data = zip(*[df[col] for col in attr_col_headings])
+        # convert each column to a list of Python scalars in one C-level
+        # call and zip the columns, rather than boxing values row by row
+        attribute_data = zip(*[df[col].tolist() for col in attr_col_headings])
     except (KeyError, TypeError) as e:
         msg = f"Invalid edge_attr argument: {edge_attr}"
         raise nx.NetworkXError(msg) from e
@@ -447,13 +481,15 @@ def from_pandas_edgelist(
         # => append the edge keys from the df to the bundled data
         if edge_key is not None:
             try:
-                multigraph_edge_keys = df[edge_key]
+                multigraph_edge_keys = df[edge_key].tolist()
                 attribute_data = zip(attribute_data, multigraph_edge_keys)
             except (KeyError, TypeError) as e:
                 msg = f"Invalid edge_key argument: {edge_key}"
                 raise nx.NetworkXError(msg) from e
 
-        for s, t, attrs in zip(df[source], df[target], attribute_data):
+        for s, t, attrs in zip(
+            df[source].tolist(), df[target].tolist(), attribute_data
+        ):
             if edge_key is not None:
                 attrs, multigraph_edge_key = attrs
                 key = g.add_edge(s, t, key=multigraph_edge_key)
@@ -462,9 +498,13 @@ def from_pandas_edgelist(
 
             g[s][t][key].update(zip(attr_col_headings, attrs))
     else:
-        for s, t, attrs in zip(df[source], df[target], attribute_data):
-            g.add_edge(s, t)
-            g[s][t].update(zip(attr_col_headings, attrs))
+        # build each attribute dict up front and insert all edges in bulk
+        g.add_edges_from(
+            (s, t, dict(zip(attr_col_headings, attrs)))
+            for s, t, attrs in zip(
+                df[source].tolist(), df[target].tolist(), attribute_data
+            )
+        )
 
     return g
 
@@ -741,29 +781,40 @@ def to_numpy_recarray(G, nodelist=None, dtype=None, order=None):
 
     if nodelist is None:
         nodelist = list(G)
-        nodeset = G
-        nlen = len(G)
     else:
-        nlen = len(nodelist)
-        nodeset = set(G.nbunch_iter(nodelist))
-        if nlen != len(nodeset):
-            for n in nodelist:
-                if n not in G:
-                    raise nx.NetworkXError(f"Node {n} in nodelist is not in G")
-            raise nx.NetworkXError("nodelist contains duplicates.")
+        for n in nodelist:
+            if n not in G:
+                raise nx.NetworkXError(f"Node {n} in nodelist is not in G")
+    nlen = len(nodelist)
+    index = dict(zip(nodelist, range(nlen)))
+    if len(index) < nlen:
+        raise nx.NetworkXError("nodelist contains duplicates.")
+    if nlen < len(G):
+        G = G.subgraph(nodelist)
 
     undirected = not G.is_directed()
-    index = dict(zip(nodelist, range(nlen)))
     M = np.zeros((nlen, nlen), dtype=dtype, order=order)
 
     names = M.dtype.names
+    # collect edge positions and one list of values per field, then assign
+    # each field with a single fancy-indexing call
+    i, j = [], []
+    field_values = {n: [] for n in names}
     for u, v, attrs in G.edges(data=True):
-        if (u in nodeset) and (v in nodeset):
-            i, j = index[u], index[v]
-            values = tuple([attrs[n] for n in names])
-            M[i, j] = values
-            if undirected:
-                M[j, i] = M[i, j]
+        i.append(index[u])
+        j.append(index[v])
+        for n in names:
+            field_values[n].append(attrs[n])
+
+    # convert the positions and values to arrays once, so they are not
+    # converted again for every scatter (and every field, for positions)
+    i = np.array(i, dtype=np.intp)
+    j = np.array(j, dtype=np.intp)
+    for n, values in field_values.items():
+        values = np.array(values, dtype=M.dtype[n])
+        M[n][i, j] = values
+        if undirected:
+            M[n][j, i] = values
 
     return M.view(np.recarray)
 
@@ -848,53 +899,99 @@ def to_scipy_sparse_matrix(G, nodelist=None, dtype=None, weight="weight", format
     .. [1] Scipy Dev. References, "Sparse Matrices",
        https://docs.scipy.org/doc/scipy/reference/sparse.html
     """
+    import numpy as np
     import scipy as sp
     import scipy.sparse  # call as sp.sparse
 
     if len(G) == 0:
         raise nx.NetworkXError("Graph has no nodes or edges")
 
+    given_nodelist = nodelist
     if nodelist is None:
         nodelist = list(G)
-        nlen = len(G)
     else:
-        nlen = len(nodelist)
-        if nlen == 0:
+        if len(nodelist) == 0:
             raise nx.NetworkXError("nodelist has no nodes")
-        nodeset = set(G.nbunch_iter(nodelist))
-        if nlen != len(nodeset):
-            for n in nodelist:
-                if n not in G:
-                    raise nx.NetworkXError(f"Node {n} in nodelist is not in G")
-            raise nx.NetworkXError("nodelist contains duplicates.")
-        if nlen < len(G):
-            G = G.subgraph(nodelist)
-
+        for n in nodelist:
+            if n not in G:
+                raise nx.NetworkXError(f"Node {n} in nodelist is not in G")
+    nlen = len(nodelist)
     index = dict(zip(nodelist, range(nlen)))
-    coefficients = zip(
-        *((index[u], index[v], wt) for u, v, wt in G.edges(data=weight, default=1))
-    )
-    try:
-        row, col, data = coefficients
-    except ValueError:
-        # there is no edge in the subgraph
-        row, col, data = [], [], []
+    if len(index) < nlen:
+        raise nx.NetworkXError("nodelist contains duplicates.")
+    if nlen < len(G):
+        G = G.subgraph(nodelist)
+
+    if weight is None and dtype is None and not nx.is_empty(G):
+        # like a list of ones, the entries default to int, except that an
+        # empty matrix defaults to float
+        dtype = int
+
+    if format in ("csr", "csc") and G.is_directed() and not G.is_multigraph():
+        # Build the compressed arrays directly from the successors (CSR) or
+        # predecessors (CSC) of each node, skipping the COO intermediate.
+        adj = G._adj if format == "csr" else G._pred
+        indptr = np.empty(nlen + 1, dtype=np.intp)
+        indptr[0] = 0
+        indices = []
+        data = []
+        for i, u in enumerate(nodelist):
+            nbrs = adj[u]
+            indices.extend(map(index.__getitem__, nbrs))
+            if weight is not None:
+                data.extend(d.get(weight, 1) for d in nbrs.values())
+            indptr[i + 1] = len(indices)
+        if weight is None:
+            data = np.ones(len(indices), dtype=dtype)
+        if format == "csr":
+            M = sp.sparse.csr_matrix((data, indices, indptr), (nlen, nlen), dtype=dtype)
+        else:
+            M = sp.sparse.csc_matrix((data, indices, indptr), (nlen, nlen), dtype=dtype)
+        M.sort_indices()
+        return M
+
+    # fill preallocated buffers with the endpoints (and weights) in a single
+    # pass over the edges, then map the endpoints to positions in bulk
+    nedges = G.number_of_edges()
+    row = [None] * nedges
+    col = [None] * nedges
+    if weight is None:
+        # unweighted: every entry is 1, so only the endpoints are needed
+        for k, (u, v) in enumerate(G.edges()):
+            row[k] = u
+            col[k] = v
+        data = np.ones(nedges, dtype=dtype)
+    else:
+        data = [None] * nedges
+        for k, (u, v, wt) in enumerate(G.edges(data=weight, default=1)):
+            row[k] = u
+            col[k] = v
+            data[k] = wt
+        data = np.array(data, dtype=dtype)
+    if (
+        _int_labels(G, given_nodelist)
+        and min(nodelist) >= 0
+        and max(nodelist) < 2 * nlen
+    ):
+        # Small nonnegative integer labels: one lookup into an array indexed
+        # by label maps all the endpoints at once.
+        idx = np.full(max(nodelist) + 1, -1, dtype=np.intp)
+        idx[list(nodelist)] = np.arange(nlen)
+        row = idx[row]
+        col = idx[col]
+    else:
+        row = np.fromiter(map(index.__getitem__, row), dtype=np.intp, count=nedges)
+        col = np.fromiter(map(index.__getitem__, col), dtype=np.intp, count=nedges)
 
     if G.is_directed():
         M = sp.sparse.coo_matrix((data, (row, col)), shape=(nlen, nlen), dtype=dtype)
     else:
-        # symmetrize matrix
-        d = data + data
-        r = row + col
-        c = col + row
-        # selfloop entries get double counted when symmetrizing
-        # so we subtract the data on the diagonal
-        selfloops = list(nx.selfloop_edges(G, data=weight, default=1))
-        if selfloops:
-            diag_index, diag_data = zip(*((index[u], -wt) for u, v, wt in selfloops))
-            d += diag_data
-            r += diag_index
-            c += diag_index
+        # symmetrize matrix; selfloop entries would be double counted by the
+        # mirrored copy, so only the off-diagonal entries are mirrored
+        offdiag = row != col
+        d = np.concatenate((data, data[offdiag]))
+        r = np.concatenate((row, col[offdiag]))
+        c = np.concatenate((col, row[offdiag]))
         M = sp.sparse.coo_matrix((d, (r, c)), shape=(nlen, nlen), dtype=dtype)
     try:
         return M.asformat(format)
@@ -904,28 +1001,19 @@ def to_scipy_sparse_matrix(G, nodelist=None, dtype=None, weight="weight", format
         raise nx.NetworkXError(f"Unknown sparse matrix format: {format}") from e
 
 
-def _csr_gen_triples(A):
-    """Converts a SciPy sparse matrix in **Compressed Sparse Row** format to
-    an iterable of weighted edge triples.
-
-    """
-    nrows = A.shape[0]
-    data, indices, indptr = A.data, A.indices, A.indptr
-    for i in range(nrows):
-        for j in range(indptr[i], indptr[i + 1]):
-            yield i, indices[j], data[j]
-
+def _int_labels(G, nodelist=None):
+    """Returns True if the nodes of `G` and of `nodelist` are all ints.
 
-def _csc_gen_triples(A):
-    """Converts a SciPy sparse matrix in **Compressed Sparse Column** format to
-    an iterable of weighted edge triples.
+    Array positions computed directly from node labels, rather than looked
+    up in the `index` dict, need G's own keys to be ints as well: keys such
+    as True or 1.0 compare equal to the int labels in `nodelist` but are not
+    valid positions.  A `nodelist` of None stands for the nodes of `G`, so
+    that they are only scanned once.
 
     """
-    ncols = A.shape[1]
-    data, indices, indptr = A.data, A.indices, A.indptr
-    for i in range(ncols):
-        for j in range(indptr[i], indptr[i + 1]):
-            yield indices[j], i, data[j]
+    if nodelist is not None and not all(type(n) is int for n in nodelist):
+        return False
+    return all(type(n) is int for n in G)
 
 
 def _coo_gen_triples(A):
@@ -934,16 +1022,7 @@ def _coo_gen_triples(A):
 
     """
     row, col, data = A.row, A.col, A.data
-    return zip(row, col, data)
-
-
-def _dok_gen_triples(A):
-    """Converts a SciPy sparse matrix in **Dictionary of Keys** format to an
-    iterable of weighted edge triples.
-
-    """
-    for (r, c), v in A.items():
-        yield r, c, v
+    return zip(row.tolist(), col.tolist(), data.tolist())
 
 
 def _generate_weighted_edges(A):
@@ -953,13 +1032,9 @@ def _generate_weighted_edges(A):
     `A` is a SciPy sparse matrix (in any format).
 
     """
-    if A.format == "csr":
-        return _csr_gen_triples(A)
-    if A.format == "csc":
-        return _csc_gen_triples(A)
-    if A.format == "dok":
-        return _dok_gen_triples(A)
-    # If A is in any other format (including COO), convert it to COO format.
+    # Every format is read through its COO form: the conversion expands the
+    # compressed formats' index pointers in C, and explicitly stored zeros
+    # and duplicate entries are kept, so each stored entry yields a triple.
     return _coo_gen_triples(A.tocoo())
 
 
@@ -1031,39 +1106,45 @@ def from_scipy_sparse_matrix(
     AtlasView({0: {'weight': 1}, 1: {'weight': 1}})
 
     """
+    import numpy as np
+    import scipy as sp
+    import scipy.sparse  # call as sp.sparse
+
     G = nx.empty_graph(0, create_using)
     n, m = A.shape
     if n != m:
         raise nx.NetworkXError(f"Adjacency matrix not square: nx,ny={A.shape}")
     # Make sure we get even the isolated nodes of the graph.
     G.add_nodes_from(range(n))
-    # Create an iterable over (u, v, w) triples and for each triple, add an
-    # edge from u to v with weight w.
-    triples = _generate_weighted_edges(A)
+    # If we are creating an undirected multigraph, only add the edges from the
+    # upper triangle of the matrix. Otherwise, add all the edges.
+    #
+    # Without this check, we run into a problem where each edge is added twice
+    # when `G.add_weighted_edges_from()` is invoked below.
+    if G.is_multigraph() and not G.is_directed():
+        A = sp.sparse.triu(A)
     # If the entries in the adjacency matrix are integers, the graph is a
     # multigraph, and parallel_edges is True, then create parallel edges, each
     # with weight 1, for each entry in the adjacency matrix. Otherwise, create
     # one edge for each positive entry in the adjacency matrix and set the
     # weight of that edge to be the entry in the matrix.
     if A.dtype.kind in ("i", "u") and G.is_multigraph() and parallel_edges:
-        chain = itertools.chain.from_iterable
-        # The following line is equivalent to:
+        # The following lines are equivalent to:
         #
         #     for (u, v) in edges:
         #         for d in range(A[u, v]):
         #             G.add_edge(u, v, weight=1)
         #
-        triples = chain(((u, v, 1) for d in range(w)) for (u, v, w) in triples)
-    # If we are creating an undirected multigraph, only add the edges from the
-    # upper triangle of the matrix. Otherwise, add all the edges. This relies
-    # on the fact that the vertices created in the
-    # `_generated_weighted_edges()` function are actually the row/column
-    # indices for the matrix `A`.
-    #
-    # Without this check, we run into a problem where each edge is added twice
-    # when `G.add_weighted_edges_from()` is invoked below.
-    if G.is_multigraph() and not G.is_directed():
-        triples = ((u, v, d) for u, v, d in triples if u <= v)
+        # with the repetition of each (u, v) done by np.repeat.
+        A = A.tocoo()
+        # np.repeat only accepts counts it can safely cast to intp
+        counts = np.maximum(A.data, 0).astype(np.intp)
+        rows, cols = np.repeat(A.row, counts), np.repeat(A.col, counts)
+        triples = zip(rows.tolist(), cols.tolist(), itertools.repeat(1))
+    else:
+        # Create an iterable over (u, v, w) triples and for each triple, add an
+        # edge from u to v with weight w.
+        triples = _generate_weighted_edges(A)
     G.add_weighted_edges_from(triples, weight=edge_attribute)
     return G
 
@@ -1113,6 +1194,10 @@ def to_numpy_array(
         However, this could be undesirable if there are array values
         corresponding to actual edges that also have the value zero. If so,
         one might prefer nonedges to have some other value, such as nan.
+        For simple graphs, and for multigraphs combined with `min` or `max`,
+        edges whose weight is nan are indistinguishable from nonedges and are
+        also set to this value. With the default `multigraph_weight=sum`,
+        entries whose parallel edges all have nan weights are set to 0.
 
     Returns
     -------
@@ -1170,26 +1255,24 @@ def to_numpy_array(
     """
     import numpy as np
 
+    given_nodelist = nodelist
     if nodelist is None:
         nodelist = list(G)
-        nodeset = G
-        nlen = len(G)
     else:
-        nlen = len(nodelist)
-        nodeset = set(G.nbunch_iter(nodelist))
-        if nlen != len(nodeset):
-            for n in nodelist:
-                if n not in G:
-                    raise nx.NetworkXError(f"Node {n} in nodelist is not in G")
-            raise nx.NetworkXError("nodelist contains duplicates.")
+        for n in nodelist:
+            if n not in G:
+                raise nx.NetworkXError(f"Node {n} in nodelist is not in G")
+    nlen = len(nodelist)
+    index = dict(zip(nodelist, range(nlen)))
+    if len(index) < nlen:
+        raise nx.NetworkXError("nodelist contains duplicates.")
 
     undirected = not G.is_directed()
-    index = dict(zip(nodelist, range(nlen)))
 
-    # Initially, we start with an array of nans.  Then we populate the array
-    # using data from the graph.  Afterwards, any leftover nans will be
-    # converted to the value of `nonedge`.  Note, we use nans initially,
-    # instead of zero, for two reasons:
+    # For multi(di)graphs, we initially start with an array of nans.  Then we
+    # populate the array using data from the graph.  Afterwards, any leftover
+    # nans will be converted to the value of `nonedge`.  Note, we use nans
+    # initially, instead of zero, for two reasons:
     #
     #   1) It can be important to distinguish a real edge with the value 0
     #      from a nonedge with the value 0.
@@ -1221,31 +1304,81 @@ def to_numpy_array(
     if G.is_multigraph():
         # Handle MultiGraphs and MultiDiGraphs
         A = np.full((nlen, nlen), np.nan, order=order)
-        # use numpy nan-aware operations
-        operator = {sum: np.nansum, min: np.nanmin, max: np.nanmax}
+        # use numpy ufuncs whose unbuffered `at` method combines all the
+        # parallel edges of an entry in a single call
+        operator = {sum: np.add, min: np.fmin, max: np.fmax}
         try:
             op = operator[multigraph_weight]
         except Exception as e:
             raise ValueError("multigraph_weight must be sum, min, or max") from e
 
-        for u, v, attrs in G.edges(data=True):
-            if (u in nodeset) and (v in nodeset):
-                i, j = index[u], index[v]
-                e_weight = attrs.get(weight, 1)
-                A[i, j] = op([e_weight, A[i, j]])
-                if undirected:
-                    A[j, i] = A[i, j]
+        # gather the positions and weights of the edges in one pass; for a
+        # partial nodelist only the edges leaving its nodes are visited
+        i, j, wts = [], [], []
+        nbunch = nodelist if nlen < len(G) else None
+        for u, v, attrs in G.edges(nbunch, data=True):
+            if v in index:
+                i.append(index[u])
+                j.append(index[v])
+                wts.append(attrs.get(weight, 1))
+        i = np.array(i, dtype=np.intp)
+        j = np.array(j, dtype=np.intp)
+        wts = np.array(wts, dtype=float)
+        if undirected:
+            # mirror the entries, but not selfloops onto themselves
+            offdiag = i != j
+            i, j = np.concatenate((i, j[offdiag])), np.concatenate((j, i[offdiag]))
+            wts = np.concatenate((wts, wts[offdiag]))
+        if multigraph_weight is sum:
+            # As with nansum, entries with edges start from 0 and nan weights
+            # are ignored.
+            wts[np.isnan(wts)] = 0
+            A[i, j] = 0
+        # fmin/fmax ignore nan, so entries start from (and, if all their
+        # weights are nan, keep) the initial nan, as with nanmin/nanmax.
+        op.at(A, (i, j), wts)
     else:
-        # Graph or DiGraph, this is much faster than above
-        A = np.full((nlen, nlen), np.nan, order=order)
+        # Graph or DiGraph, this is much faster than above.  Every entry is
+        # written by at most one edge, so no nan sentinel is needed: allocate
+        # the result once in its final dtype, prefilled with `nonedge`, and
+        # scatter the edge weights into it with a single fancy-indexing call.
+        if dtype is None:
+            dtype = np.float64
+        A = np.full((nlen, nlen), nonedge, dtype=dtype, order=order)
+        # when the nodes are the integers 0..nlen-1 in order, each neighbor is
+        # already its own column and the `index` lookups can be skipped
+        contiguous = all(n == k for k, n in enumerate(nodelist)) and _int_labels(
+            G, given_nodelist
+        )
+        # gather the entries a whole row at a time with bulk list extends
+        i, j, wts = [], [], []
         for u, nbrdict in G.adjacency():
-            for v, d in nbrdict.items():
-                try:
-                    A[index[u], index[v]] = d.get(weight, 1)
-                except KeyError:
-                    # This occurs when there are fewer desired nodes than
-                    # there are nodes in the graph: len(nodelist) < len(G)
-                    pass
+            # Nodes missing from `index` occur when there are fewer desired
+            # nodes than there are nodes in the graph: len(nodelist) < len(G)
+            if u not in index:
+                continue
+            if nlen < len(G):
+                nbrs = [v for v in nbrdict if v in index]
+                datadicts = map(nbrdict.__getitem__, nbrs)
+            else:
+                nbrs = nbrdict
+                datadicts = nbrdict.values()
+            i.extend([index[u]] * len(nbrs))
+            j.extend(nbrs if contiguous else map(index.__getitem__, nbrs))
+            # unweighted: only the positions of the entries are needed
+            if weight is not None:
+                wts.extend([d.get(weight, 1) for d in datadicts])
+        if weight is None:
+            A[i, j] = 1
+        else:
+            if A.dtype.kind != "O":
+                # map nan weights (and weights such as None, which cast to nan)
+                # to nonedges on a float copy, as min/max do for multigraphs,
+                # so that they never reach a non-float result array
+                wts = np.asarray(wts, dtype=complex if A.dtype.kind == "c" else float)
+                wts[np.isnan(wts)] = nonedge
+            A[i, j] = wts
+        return A
 
     A[np.isnan(A)] = nonedge
     A = np.asarray(A, dtype=dtype)
@@ -1339,6 +1472,8 @@ def from_numpy_array(A, parallel_edges=False, create_using=None):
     1.0
 
     """
+    import numpy as np
+
     kind_to_python_type = {
         "f": float,
         "i": int,
@@ -1364,24 +1499,36 @@ def from_numpy_array(A, parallel_edges=False, create_using=None):
     # Make sure we get even the isolated nodes of the graph.
     G.add_nodes_from(range(n))
     # Get a list of all the entries in the array with nonzero entries. These
-    # coordinates become edges in the graph. (convert to int from np.int64)
-    edges = ((int(e[0]), int(e[1])) for e in zip(*A.nonzero()))
+    # coordinates become edges in the graph. The coordinates and the entries
+    # are gathered with one fancy-indexing call and converted to lists of
+    # Python scalars in bulk (avoiding per-edge np.int64 boxing).
+    rows, cols = A.nonzero()
+    # If we are creating an undirected multigraph, only add the edges from the
+    # upper triangle of the matrix. Otherwise, add all the edges.
+    #
+    # Without this check, we run into a problem where each edge is added twice
+    # when `G.add_edges_from()` is invoked below.
+    if G.is_multigraph() and not G.is_directed():
+        upper = rows <= cols
+        rows, cols = rows[upper], cols[upper]
+    # (np.asarray so that np.matrix input also gives a flat array of entries)
+    entries = np.asarray(A)[rows, cols]
     # handle numpy constructed data type
     if python_type == "void":
         # Sort the fields by their offset, then by dtype, then by name.
         fields = sorted(
             (offset, dtype, name) for name, (dtype, offset) in A.dtype.fields.items()
         )
+        # convert the entries one field (column) at a time, then zip the
+        # converted columns back together into one attribute dict per edge
+        names = [name for _, _, name in fields]
+        columns = [
+            list(map(kind_to_python_type[dtype.kind], entries[name].tolist()))
+            for _, dtype, name in fields
+        ]
         triples = (
-            (
-                u,
-                v,
-                {
-                    name: kind_to_python_type[dtype.kind](val)
-                    for (_, dtype, name), val in zip(fields, A[u, v])
-                },
-            )
-            for u, v in edges
+            (u, v, dict(zip(names, vals)))
+            for u, v, vals in zip(rows.tolist(), cols.tolist(), zip(*columns))
         )
     # If the entries in the adjacency matrix are integers, the graph is a
     # multigraph, and parallel_edges is True, then create parallel edges, each
@@ -1389,27 +1536,21 @@ def from_numpy_array(A, parallel_edges=False, create_using=None):
     # one edge for each positive entry in the adjacency matrix and set the
     # weight of that edge to be the entry in the matrix.
     elif python_type is int and G.is_multigraph() and parallel_edges:
-        chain = itertools.chain.from_iterable
-        # The following line is equivalent to:
+        # The following lines are equivalent to:
         #
         #     for (u, v) in edges:
         #         for d in range(A[u, v]):
         #             G.add_edge(u, v, weight=1)
         #
-        triples = chain(
-            ((u, v, {"weight": 1}) for d in range(A[u, v])) for (u, v) in edges
-        )
+        # with the repetition of each (u, v) done by np.repeat.
+        # np.repeat only accepts counts it can safely cast to intp
+        counts = np.maximum(entries, 0).astype(np.intp)
+        rows, cols = np.repeat(rows, counts), np.repeat(cols, counts)
+        triples = ((u, v, {"weight": 1}) for u, v in zip(rows.tolist(), cols.tolist()))
     else:  # basic data type
-        triples = ((u, v, dict(weight=python_type(A[u, v]))) for u, v in edges)
-    # If we are creating an undirected multigraph, only add the edges from the
-    # upper triangle of the matrix. Otherwise, add all the edges. This relies
-    # on the fact that the vertices created in the
-    # `_generated_weighted_edges()` function are actually the row/column
-    # indices for the matrix `A`.
-    #
-    # Without this check, we run into a problem where each edge is added twice
-    # when `G.add_edges_from()` is invoked below.
-    if G.is_multigraph() and not G.is_directed():
-        triples = ((u, v, d) for u, v, d in triples if u <= v)
+        triples = (
+            (u, v, dict(weight=python_type(w)))
+            for u, v, w in zip(rows.tolist(), cols.tolist(), entries.tolist())
+        )
     G.add_edges_from(triples)
     return G
@@ -458,7 +458,7 @@ def fruchterman_reingold_layout(
             if node not in pos:
                 raise ValueError("nodes are fixed without positions given")
         nfixed = {node: i for i, node in enumerate(G)}
-        fixed = np.asarray([nfixed[node] for node in fixed])
+        fixed = np.asarray([nfixed[node] for node in fixed], dtype=int)
 
     if pos is not None:
         # Determine size of existing domain to adjust initial positions
@@ -588,11 +588,11 @@ def _sparse_fruchterman_reingold(
     except AttributeError as e:
         msg = "fruchterman_reingold() takes an adjacency matrix as input"
         raise nx.NetworkXError(msg) from e
-    # make sure we have a LIst of Lists representation
+    # make sure we have a Compressed Sparse Row representation
     try:
-        A = A.tolil()
+        A = A.tocsr()
     except AttributeError:
-        A = (sp.sparse.coo_matrix(A)).tolil()
+        A = sp.sparse.csr_matrix(A)
 
     if pos is None:
         # random initial positions
@@ -615,29 +615,32 @@ def _sparse_fruchterman_reingold(
     # linearly step down by dt on each iteration so last iteration is size dt.
     dt = t / float(iterations + 1)
 
-    displacement = np.zeros((dim, nnodes))
+    # number of rows handled per step; bounds the size of the
+    # (block_size, nnodes, dim) difference tensor
+    block_size = max(1, 2 ** 20 // nnodes)
+    displacement = np.zeros((nnodes, dim))
     for iteration in range(iterations):
-        displacement *= 0
-        # loop over rows
-        for i in range(A.shape[0]):
-            if i in fixed:
-                continue
-            # difference between this row's node position and all others
-            delta = (pos[i] - pos).T
+        # loop over blocks of rows
+        for start in range(0, nnodes, block_size):
+            stop = min(start + block_size, nnodes)
+            # difference between this block's node positions and all others
+            delta = pos[start:stop, np.newaxis, :] - pos[np.newaxis, :, :]
             # distance between points
-            distance = np.sqrt((delta ** 2).sum(axis=0))
+            distance = np.linalg.norm(delta, axis=-1)
             # enforce minimum distance of 0.01
-            distance = np.where(distance < 0.01, 0.01, distance)
-            # the adjacency matrix row
-            Ai = np.asarray(A.getrowview(i).toarray())
+            np.clip(distance, 0.01, None, out=distance)
+            # the adjacency matrix rows
+            Ai = A[start:stop].toarray()
             # displacement "force"
-            displacement[:, i] += (
-                delta * (k * k / distance ** 2 - Ai * distance / k)
-            ).sum(axis=1)
+            displacement[start:stop] = np.einsum(
+                "ijk,ij->ik", delta, (k * k / distance ** 2 - Ai * distance / k)
+            )
+        # don't move fixed nodes
+        displacement[fixed] = 0.0
         # update positions
-        length = np.sqrt((displacement ** 2).sum(axis=0))
+        length = np.linalg.norm(displacement, axis=-1)
         length = np.where(length < 0.01, 0.1, length)
-        delta_pos = (displacement * t / length).T
+        delta_pos = np.einsum("ij,i->ij", displacement, t / length)
         pos += delta_pos
         # cool temperature
         t -= dt
@@ -198,6 +198,12 @@ class TestLayout:
         for axis in range(2):
             assert almost_equal(pos[(0, 0)][axis], npos[(0, 0)][axis])
 
+    def test_empty_fixed_fruchterman_reingold(self):
+        # an empty `fixed` must still index the position arrays
+        for G in (self.Gi, self.bigG):
+            pos = nx.circular_layout(G)
+            nx.spring_layout(G, pos=pos, fixed=[], seed=42)
+
     def test_center_parameter(self):
         G = nx.path_graph(1)
         nx.random_layout(G, center=(1, 1))
@@ -538,3 +538,113 @@ def test_to_numpy_array_multigraph_nodelist(multigraph_test_graph):
     A = nx.to_numpy_array(G, nodelist=[1, 2])
     assert A.shape == (2, 2)
     assert A[1, 0] == 77
+
+
+@pytest.mark.parametrize("graph_type", (nx.Graph, nx.DiGraph))
+def test_to_numpy_array_unweighted_nodelist(graph_type):
+    G = graph_type([(0, 1, {"weight": 5}), (1, 2, {"weight": 7}), (2, 2)])
+    A = nx.to_numpy_array(G, nodelist=[2, 1], weight=None, nonedge=-1)
+    expected = [[1, -1], [1, -1]] if G.is_directed() else [[1, 1], [1, -1]]
+    np.testing.assert_array_equal(A, np.array(expected))
+
+
+@pytest.mark.parametrize(
+    "nodelist", ([0, 1, 2], [0.0, 1.0, 2.0], [False, True, 2], [2, 1, 0])
+)
+def test_to_numpy_array_range_like_nodes(nodelist):
+    G = nx.DiGraph()
+    G.add_nodes_from(nodelist)
+    G.add_edges_from([(nodelist[0], nodelist[1]), (nodelist[1], nodelist[2])])
+    A = nx.to_numpy_array(G, nodelist=nodelist)
+    expected = [[0, 1, 0], [0, 0, 1], [0, 0, 0]]
+    np.testing.assert_array_equal(A, np.array(expected))
+
+
+def test_to_numpy_array_int_nodelist_non_int_keys():
+    G = nx.DiGraph([(0, 1.0), (1.0, 2)])
+    A = nx.to_numpy_array(G, nodelist=[0, 1, 2])
+    expected = [[0, 1, 0], [0, 0, 1], [0, 0, 0]]
+    np.testing.assert_array_equal(A, np.array(expected))
+    G = nx.Graph([(True, False)])
+    A = nx.to_numpy_array(G, nodelist=[0, 1])
+    np.testing.assert_array_equal(A, np.array([[0, 1], [1, 0]]))
+
+
+@pytest.mark.parametrize("graph_type", (nx.Graph, nx.DiGraph))
+def test_to_numpy_array_nan_weight_is_nonedge(graph_type):
+    G = graph_type([(0, 1, {"weight": np.nan}), (1, 2, {"weight": 3})])
+    A = nx.to_numpy_array(G, nonedge=-1)
+    if G.is_directed():
+        expected = [[-1, -1, -1], [-1, -1, 3], [-1, -1, -1]]
+    else:
+        expected = [[-1, -1, -1], [-1, -1, 3], [-1, 3, -1]]
+    np.testing.assert_array_equal(A, np.array(expected))
+    # non-float weights such as None also end up as nonedges
+    G = graph_type()
+    G.add_edge(0, 1, weight=None)
+    A = nx.to_numpy_array(G)
+    np.testing.assert_array_equal(A, np.zeros((2, 2)))
+    # ... and both map to nonedge for a non-float result too
+    G.add_edge(1, 2, weight=np.nan)
+    G.add_edge(2, 0, weight=3)
+    A = nx.to_numpy_array(G, dtype=int, nonedge=-1)
+    assert A.dtype == int
+    if G.is_directed():
+        expected = [[-1, -1, -1], [-1, -1, -1], [3, -1, -1]]
+    else:
+        expected = [[-1, -1, 3], [-1, -1, -1], [3, -1, -1]]
+    np.testing.assert_array_equal(A, np.array(expected))
+
+
+@pytest.mark.parametrize("graph_type", (nx.MultiGraph, nx.MultiDiGraph))
+def test_to_numpy_array_multigraph_sum_selfloops_and_nan(graph_type):
+    G = graph_type()
+    G.add_edge(0, 0, weight=2)
+    G.add_edge(0, 0)
+    G.add_edge(0, 1, weight=np.nan)
+    G.add_edge(1, 2, weight=np.nan)
+    G.add_edge(1, 2, weight=4)
+    A = nx.to_numpy_array(G, nonedge=-1)
+    if G.is_directed():
+        expected = [[3, 0, -1], [-1, -1, 4], [-1, -1, -1]]
+    else:
+        expected = [[3, 0, -1], [0, -1, 4], [-1, 4, -1]]
+    np.testing.assert_array_equal(A, np.array(expected))
+
+
+@pytest.mark.parametrize(
+    ("operator", "expected"),
+    ((min, [[1, -1], [-1, 3]]), (max, [[2, -1], [-1, 5]])),
+)
+def test_to_numpy_array_multigraph_minmax_nan(operator, expected):
+    G = nx.MultiGraph()
+    G.add_edge(0, 0, weight=2)
+    G.add_edge(0, 0)
+    G.add_edge(0, 1, weight=np.nan)
+    G.add_edge(1, 1, weight=np.nan)
+    G.add_edge(1, 1, weight=5)
+    G.add_edge(1, 1, weight=3)
+    A = nx.to_numpy_array(G, multigraph_weight=operator, nonedge=-1)
+    np.testing.assert_array_equal(A, np.array(expected))
+
+
+@pytest.mark.parametrize(
+    ("nodelist", "errmsg"),
+    (
+        ([2, 3], "in nodelist is not in G"),
+        ([1, 1], "nodelist contains duplicates"),
+        ([1, 1, 7], "in nodelist is not in G"),
+    ),
+)
+def test_to_numpy_array_bad_nodelist(recarray_nodelist_test_graph, nodelist, errmsg):
+    with pytest.raises(nx.NetworkXError, match=errmsg):
+        nx.to_numpy_array(recarray_nodelist_test_graph, nodelist=nodelist)
+
+
+@pytest.mark.parametrize("dt", (np.uint8, np.uint32, np.uint64))
+def test_from_numpy_array_parallel_edges_unsigned(dt):
+    A = np.array([[0, 2], [2, 0]], dtype=dt)
+    G = nx.from_numpy_array(A, parallel_edges=True, create_using=nx.MultiGraph)
+    expected = nx.MultiGraph()
+    expected.add_edges_from([(0, 1), (0, 1)], weight=1)
+    assert_graphs_equal(G, expected)
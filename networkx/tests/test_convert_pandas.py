@@ -321,3 +321,21 @@ def test_to_pandas_edgelist_with_nodelist():
     df = nx.to_pandas_edgelist(G, nodelist=[1, 2])
     assert 0 not in df["source"].to_numpy()
     assert 100 not in df["weight"].to_numpy()
+
+
+def test_to_pandas_edgelist_with_nodelist_and_edge_key():
+    G = nx.MultiGraph()
+    G.add_edge(0, 1, key="a", weight=1)
+    G.add_edge(2, 3, key="b", weight=2)
+    G.add_edge(1, 2, key="c", weight=3)
+    df = nx.to_pandas_edgelist(G, nodelist=[2], edge_key="ekey")
+    assert list(df["ekey"]) == ["b", "c"]
+    assert list(df["weight"]) == [2, 3]
+
+
+@pytest.mark.parametrize("graph", [nx.DiGraph, nx.MultiDiGraph])
+def test_from_pandas_adjacency_permuted_int_labels(graph):
+    df = pd.DataFrame([[0, 1], [2, 0]], index=[1, 0], columns=[1, 0])
+    G = nx.from_pandas_adjacency(df, create_using=graph)
+    assert list(G) == [1, 0]
+    assert_edges_equal(G.edges(data="weight"), [(1, 0, 1), (0, 1, 2)])
@@ -284,3 +284,82 @@ def test_from_scipy_sparse_matrix_formats(sparse_format):
     )
     A = sp.sparse.coo_matrix([[0, 3, 2], [3, 0, 1], [2, 1, 0]]).asformat(sparse_format)
     assert_graphs_equal(expected, nx.from_scipy_sparse_matrix(A))
+
+
+@pytest.mark.parametrize("sparse_format", ("csr", "csc"))
+@pytest.mark.parametrize("nodelist", (None, [3, 2, 1], [3, 1]))
+def test_to_scipy_sparse_matrix_compressed_digraph(sparse_format, nodelist):
+    """Compressed formats built directly from the adjacency of a digraph match
+    the COO construction."""
+    G = nx.DiGraph([(3, 1, {"weight": 2}), (1, 2), (2, 2), (2, 3), (1, 3)])
+    G.add_node(4)
+    expected = nx.to_scipy_sparse_matrix(G, nodelist=nodelist, format="coo")
+    M = nx.to_scipy_sparse_matrix(G, nodelist=nodelist, format=sparse_format)
+    assert M.format == sparse_format
+    assert M.dtype == expected.dtype
+    assert M.has_sorted_indices
+    np.testing.assert_equal(M.toarray(), expected.toarray())
+
+
+@pytest.mark.parametrize("nodelist", ((5, 0, 2, 3), ("a", 0, 2, 3), (30, 0, 2, 3)))
+def test_to_scipy_sparse_matrix_node_labels(nodelist):
+    """Integer labels (mapped through a label-indexed array when compact) give
+    the same matrix as any other labels."""
+    G = nx.relabel_nodes(nx.path_graph(4), dict(enumerate(nodelist)))
+    G.add_edge(nodelist[3], nodelist[3], weight=4)
+    expected = np.array([[0, 1, 0, 0], [1, 0, 1, 0], [0, 1, 0, 1], [0, 0, 1, 4]])
+    M = nx.to_scipy_sparse_matrix(G, nodelist=nodelist)
+    np.testing.assert_equal(M.toarray(), expected)
+    M = nx.to_scipy_sparse_matrix(G, nodelist=nodelist[::-1])
+    np.testing.assert_equal(M.toarray(), expected[::-1, ::-1])
+
+
+@pytest.mark.parametrize("sparse_format", ("coo", "csr", "csc"))
+def test_to_scipy_sparse_matrix_int_nodelist_non_int_keys(sparse_format):
+    G = nx.DiGraph([(0, 1.0), (1.0, 2)])
+    M = nx.to_scipy_sparse_matrix(G, nodelist=[0, 1, 2], format=sparse_format)
+    np.testing.assert_equal(M.toarray(), [[0, 1, 0], [0, 0, 1], [0, 0, 0]])
+    G = nx.Graph([(True, False)])
+    M = nx.to_scipy_sparse_matrix(G, nodelist=[0, 1], format=sparse_format)
+    np.testing.assert_equal(M.toarray(), [[0, 1], [1, 0]])
+
+
+@pytest.mark.parametrize("sparse_format", ("coo", "csr", "csc"))
+@pytest.mark.parametrize(
+    ("graph_type", "expected"),
+    (
+        (nx.MultiGraph, [[0, 2, 0], [2, 1, 1], [0, 1, 0]]),
+        (nx.MultiDiGraph, [[0, 2, 0], [0, 1, 1], [0, 0, 0]]),
+        (nx.DiGraph, [[0, 1, 0], [0, 1, 1], [0, 0, 0]]),
+    ),
+)
+def test_to_scipy_sparse_matrix_unweighted(sparse_format, graph_type, expected):
+    G = graph_type([(0, 1, {"weight": 3}), (0, 1), (1, 1), (1, 2, {"weight": 5})])
+    M = nx.to_scipy_sparse_matrix(G, weight=None, format=sparse_format)
+    assert M.dtype == int
+    np.testing.assert_equal(M.toarray(), expected)
+    M = nx.to_scipy_sparse_matrix(G, weight=None, dtype=float, format=sparse_format)
+    assert M.dtype == float
+    # without any entries the matrix keeps the float default
+    G = nx.empty_graph(3, create_using=graph_type)
+    M = nx.to_scipy_sparse_matrix(G, weight=None, format=sparse_format)
+    assert M.dtype == float
+
+
+@pytest.mark.parametrize("sparse_format", ("csr", "csc", "coo", "dok"))
+def test_from_scipy_sparse_matrix_python_scalars(sparse_format):
+    """Edges and weights are built from native Python scalars."""
+    A = sp.sparse.coo_matrix([[0, 2.5, 0], [0, 0, 1.5], [0, 0, 0]])
+    G = nx.from_scipy_sparse_matrix(A.asformat(sparse_format), create_using=nx.DiGraph)
+    assert sorted(G.edges(data="weight")) == [(0, 1, 2.5), (1, 2, 1.5)]
+    for u, v, w in G.edges(data="weight"):
+        assert type(u) is int and type(v) is int and type(w) is float
+
+
+@pytest.mark.parametrize("dt", (np.uint8, np.uint32, np.uint64))
+def test_from_scipy_sparse_matrix_parallel_edges_unsigned(dt):
+    A = sp.sparse.csr_matrix(np.array([[0, 2], [2, 0]], dtype=dt))
+    G = nx.from_scipy_sparse_matrix(A, parallel_edges=True, create_using=nx.MultiGraph)
+    expected = nx.MultiGraph()
+    expected.add_edges_from([(0, 1), (0, 1)], weight=1)
+    assert_graphs_equal(G, expected)